@@ -15,13 +15,7 @@ Usage:
 import sys
 from pathlib import Path
 
-from rekordbox_collection_reader import (
-    parse_collection,
-    genre_counts,
-    bpm_distribution,
-    key_distribution,
-    artists_by_track_count,
-)
+from rekordbox_collection_reader import parse_collection, collection_stats
 
 
 def main():
@@ -45,10 +39,12 @@ def main():
     print(f"Total tracks: {len(collection.tracks)}")
     print()
 
+    stats = collection_stats(collection)
+
     # Top genres
     print("Top 10 Genres:")
     print("-" * 30)
-    genres = genre_counts(collection)
+    genres = stats["genre_counts"]
     for genre, count in list(genres.items())[:10]:
         bar = "#" * min(count, 50)  # Cap bar length
         print(f"{genre:25} {count:4}  {bar}")
@@ -57,7 +53,7 @@ def main():
     # BPM distribution
     print("BPM Distribution (top 10):")
     print("-" * 30)
-    bpms = bpm_distribution(collection)
+    bpms = stats["bpm_distribution"]
     for bpm, count in list(bpms.items())[:10]:
         bar = "#" * min(count, 50)
         print(f"{bpm:6.0f} BPM  {count:4}  {bar}")
@@ -66,7 +62,7 @@ def main():
     # Key distribution
     print("Key Distribution (top 10):")
     print("-" * 30)
-    keys = key_distribution(collection)
+    keys = stats["key_distribution"]
     for key, count in list(keys.items())[:10]:
         bar = "#" * min(count, 50)
         print(f"{key:6}  {count:4}  {bar}")
@@ -75,7 +71,7 @@ def main():
     # Top artists
     print("Top 10 Artists:")
     print("-" * 30)
-    artists = artists_by_track_count(collection)
+    artists = stats["artists_by_track_count"]
     for artist, count in artists[:10]:
         print(f"{artist:30} {count:3} tracks")
 
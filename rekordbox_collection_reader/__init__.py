@@ -3,6 +3,7 @@
 from .helpers import (
     artists_by_track_count,
     bpm_distribution,
+    collection_stats,
     filter_tracks,
     genre_counts,
     get_playlist,
@@ -42,4 +43,5 @@ __all__ = [
     "bpm_distribution",
     "key_distribution",
     "artists_by_track_count",
+    "collection_stats",
 ]
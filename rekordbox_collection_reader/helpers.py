@@ -3,11 +3,210 @@
 from __future__ import annotations
 
 from collections import Counter
+from operator import attrgetter
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
-    from .models import Collection, Track
+    from collections.abc import Iterable
+
+    from .models import Collection, PlaylistNode, Track
+
+
+# Joins the lowercased name, artist and album into one searchable string per
+# track. XML 1.0 does not allow this control character in attribute values,
+# so it never occurs inside a field.
+_SEARCH_FIELD_SEPARATOR = "\x1f"
+
+
+class _TrackCounts(NamedTuple):
+    """Memoized Track attribute counts of a collection, see _most_common()."""
+
+    source: dict[int, Track]
+    size: int
+    # Track attribute name -> (value, count) pairs, most common first
+    by_attribute: dict[str, list[tuple[Any, int]]]
+
+
+class _FilterColumns(NamedTuple):
+    """The columns filter_tracks() compares against, in collection order."""
+
+    source: dict[int, Track]
+    size: int
+    tracks: list[Track]
+    bpms: list[float]
+    play_counts: list[int]
+    dates_added: list[date]
+    keys_lower: list[str]
+    artists_lower: list[str]
+    kinds_lower: list[str]
+    rows_by_genre: dict[str, list[int]]
+    rows_by_key: dict[str, list[int]]
+
+
+class _SearchColumns(NamedTuple):
+    """The searchable text of each track, in collection order."""
+
+    source: dict[int, Track]
+    size: int
+    tracks: list[Track]
+    texts: list[str]
+
+
+def _group_rows(values: Iterable[str]) -> dict[str, list[int]]:
+    """Map each distinct value to the ascending row indices holding it."""
+    groups: dict[str, list[int]] = {}
+    for i, value in enumerate(values):
+        rows = groups.get(value)
+        if rows is None:
+            groups[value] = [i]
+        else:
+            rows.append(i)
+    return groups
+
+
+def _is_current(
+    view: _TrackCounts | _FilterColumns | _SearchColumns | None, collection: Collection
+) -> bool:
+    """Return True if a cached view still describes ``collection.tracks``.
+
+    A view is stale when ``tracks`` is no longer the dict it was built from,
+    e.g. after ``model_copy(update={"tracks": ...})``, or when tracks were
+    added to or removed from that dict in place. Replacing a track under an
+    existing ID without changing the count is not detected.
+    """
+    return view is not None and view.source is collection.tracks and view.size == len(view.source)
+
+
+def _most_common(collection: Collection, attribute: str) -> list[tuple[Any, int]]:
+    """Return the distinct values of a Track attribute with their counts, most common first.
+
+    The result is cached on the collection; callers must copy it before
+    handing it out.
+    """
+    counts = collection._track_counts
+    if not _is_current(counts, collection):
+        tracks = collection.tracks
+        counts = _TrackCounts(source=tracks, size=len(tracks), by_attribute={})
+        collection._track_counts = counts
+    result = counts.by_attribute.get(attribute)
+    if result is None:
+        result = Counter(map(attrgetter(attribute), collection.tracks.values())).most_common()
+        counts.by_attribute[attribute] = result
+    return result
+
+
+def _filter_columns(collection: Collection) -> _FilterColumns:
+    """Return the filter view of a collection, building and caching it on first use."""
+    columns = collection._filter_columns
+    if not _is_current(columns, collection):
+        source = collection.tracks
+        tracks = list(source.values())
+        keys_lower = [track.key.lower() for track in tracks]
+        columns = _FilterColumns(
+            source=source,
+            size=len(tracks),
+            tracks=tracks,
+            bpms=[track.bpm for track in tracks],
+            play_counts=[track.play_count for track in tracks],
+            dates_added=[track.date_added for track in tracks],
+            keys_lower=keys_lower,
+            artists_lower=[track.artist.lower() for track in tracks],
+            kinds_lower=[track.kind.lower() for track in tracks],
+            rows_by_genre=_group_rows(track.genre.lower() for track in tracks),
+            rows_by_key=_group_rows(keys_lower),
+        )
+        collection._filter_columns = columns
+    return columns
+
+
+def _search_columns(collection: Collection) -> _SearchColumns:
+    """Return the search view of a collection, building and caching it on first use."""
+    columns = collection._search_columns
+    if not _is_current(columns, collection):
+        source = collection.tracks
+        tracks = list(source.values())
+        columns = _SearchColumns(
+            source=source,
+            size=len(tracks),
+            tracks=tracks,
+            texts=[
+                _SEARCH_FIELD_SEPARATOR.join(
+                    (track.name.lower(), track.artist.lower(), track.album.lower())
+                )
+                for track in tracks
+            ],
+        )
+        collection._search_columns = columns
+    return columns
+
+
+def _filter_numeric_rows(
+    columns: _FilterColumns,
+    rows: Iterable[int],
+    bpm_range: tuple[float, float] | None,
+    min_play_count: int | None,
+    date_range: tuple[date, date] | None,
+) -> list[int]:
+    """Return the rows matching all numeric criteria, checked in a single pass.
+
+    Unset criteria are skipped rather than compared, so values such as a NaN
+    BPM only affect the criteria that were actually given.
+    """
+    any_bpm = bpm_range is None
+    any_play_count = min_play_count is None
+    any_date = date_range is None
+    bpm_min, bpm_max = bpm_range or (0.0, 0.0)
+    play_count_min = min_play_count or 0
+    date_min, date_max = date_range or (date.min, date.max)
+
+    bpms = columns.bpms
+    play_counts = columns.play_counts
+    dates_added = columns.dates_added
+    return [
+        i
+        for i in rows
+        if (any_bpm or bpm_min <= bpms[i] <= bpm_max)
+        and (any_play_count or play_counts[i] >= play_count_min)
+        and (any_date or date_min <= dates_added[i] <= date_max)
+    ]
+
+
+def _index_playlists(collection: Collection, playlists: Iterable[PlaylistNode]) -> None:
+    """Cache playlist lookups on a collection, given all its playlists in tree order.
+
+    When names repeat, the index keeps the first playlist with that name.
+    """
+    index: dict[str, PlaylistNode] = {}
+    names: list[str] = []
+    for playlist in playlists:
+        index.setdefault(playlist.name, playlist)
+        names.append(playlist.name)
+    collection._playlist_index = index
+    collection._playlist_names = names
+    collection._indexed_playlists = collection.playlists
+
+
+def _ensure_playlists_indexed(collection: Collection) -> None:
+    """Build the playlist lookups if the parser did not, or if the playlist tree was replaced.
+
+    A replaced tree, e.g. from ``model_copy(update={"playlists": ...})``, is
+    detected by identity against the root node the lookups were built from.
+    """
+    if collection._playlist_index is None or collection._indexed_playlists is not collection.playlists:
+        _index_playlists(collection, collection.playlists.iter_playlists())
+
+
+def _playlist_index(collection: Collection) -> dict[str, PlaylistNode]:
+    """Return the playlist name index of a collection."""
+    _ensure_playlists_indexed(collection)
+    return collection._playlist_index
+
+
+def _playlist_names(collection: Collection) -> list[str]:
+    """Return all playlist names of a collection, in tree order."""
+    _ensure_playlists_indexed(collection)
+    return collection._playlist_names
 
 
 class CollectionHelpers:
@@ -46,42 +245,44 @@ class CollectionHelpers:
         Returns:
             List of tracks matching all specified criteria.
         """
-        results: list[Track] = []
-
-        for track in collection.tracks.values():
-            # Genre filter
-            if genre is not None and track.genre.lower() != genre.lower():
-                continue
-
-            # BPM range filter
-            if bpm_range is not None:
-                if not (bpm_range[0] <= track.bpm <= bpm_range[1]):
-                    continue
-
-            # Key filter
-            if key is not None and track.key.lower() != key.lower():
-                continue
-
-            # Artist filter (substring match)
-            if artist is not None and artist.lower() not in track.artist.lower():
-                continue
-
-            # Min play count filter
-            if min_play_count is not None and track.play_count < min_play_count:
-                continue
-
-            # Date range filter
-            if date_range is not None:
-                if not (date_range[0] <= track.date_added <= date_range[1]):
-                    continue
-
-            # Kind filter (substring match)
-            if kind is not None and kind.lower() not in track.kind.lower():
-                continue
-
-            results.append(track)
-
-        return results
+        columns = _filter_columns(collection)
+
+        # Narrow a list of row indices one criterion at a time, comparing
+        # against the precomputed columns instead of the Track objects.
+        # Genre and key are exact matches, so the starting rows come straight
+        # from an index when either is given.
+        rows: Iterable[int]
+        if genre is not None:
+            rows = columns.rows_by_genre.get(genre.lower(), [])
+        elif key is not None:
+            rows = columns.rows_by_key.get(key.lower(), [])
+        else:
+            rows = range(len(columns.tracks))
+
+        # BPM range, min play count and date range filters
+        if bpm_range is not None or min_play_count is not None or date_range is not None:
+            rows = _filter_numeric_rows(columns, rows, bpm_range, min_play_count, date_range)
+
+        # Key filter (already applied by the index lookup unless genre was given)
+        if key is not None and genre is not None:
+            key_lower = key.lower()
+            keys = columns.keys_lower
+            rows = [i for i in rows if keys[i] == key_lower]
+
+        # Artist filter (substring match)
+        if artist is not None:
+            artist_lower = artist.lower()
+            artists = columns.artists_lower
+            rows = [i for i in rows if artist_lower in artists[i]]
+
+        # Kind filter (substring match)
+        if kind is not None:
+            kind_lower = kind.lower()
+            kinds = columns.kinds_lower
+            rows = [i for i in rows if kind_lower in kinds[i]]
+
+        tracks = columns.tracks
+        return [tracks[i] for i in rows]
 
     @staticmethod
     def search(collection: Collection, query: str) -> list[Track]:
@@ -97,23 +298,24 @@ class CollectionHelpers:
             List of tracks matching the query in any of the searchable fields.
         """
         query_lower = query.lower()
-        results: list[Track] = []
-
-        for track in collection.tracks.values():
-            if (
-                query_lower in track.name.lower()
-                or query_lower in track.artist.lower()
-                or query_lower in track.album.lower()
-            ):
-                results.append(track)
+        if _SEARCH_FIELD_SEPARATOR in query_lower:
+            # Could only match across field boundaries
+            return []
 
-        return results
+        columns = _search_columns(collection)
+        tracks = columns.tracks
+        return [
+            tracks[i]
+            for i, text in enumerate(columns.texts)
+            if query_lower in text
+        ]
 
     @staticmethod
     def get_playlist(collection: Collection, name: str) -> list[Track] | None:
         """Get all tracks in a playlist by name.
 
-        Searches recursively through all playlist folders.
+        Playlists nested in folders are found too. If several playlists share
+        the name, the first one in the tree is used.
 
         Args:
             collection: The Collection containing the playlist.
@@ -122,15 +324,13 @@ class CollectionHelpers:
         Returns:
             List of Track objects in the playlist, or None if not found.
         """
-        playlist = collection.playlists.find_playlist(name)
+        playlist = _playlist_index(collection).get(name)
         if playlist is None:
             return None
 
-        return [
-            collection.tracks[key]
-            for key in playlist.track_keys
-            if key in collection.tracks
-        ]
+        # One dict probe per entry; entries for missing tracks are skipped
+        tracks = collection.tracks
+        return [track for key in playlist.track_keys if (track := tracks.get(key)) is not None]
 
     @staticmethod
     def get_playlist_names(collection: Collection) -> list[str]:
@@ -142,7 +342,7 @@ class CollectionHelpers:
         Returns:
             List of playlist names (folders are excluded).
         """
-        return [playlist.name for playlist in collection.playlists.iter_playlists()]
+        return list(_playlist_names(collection))
 
     @staticmethod
     def genre_counts(collection: Collection) -> dict[str, int]:
@@ -154,8 +354,7 @@ class CollectionHelpers:
         Returns:
             Dictionary mapping genre names to track counts, sorted by count descending.
         """
-        counter = Counter(track.genre for track in collection.tracks.values())
-        return dict(counter.most_common())
+        return dict(_most_common(collection, "genre"))
 
     @staticmethod
     def bpm_distribution(collection: Collection) -> dict[float, int]:
@@ -167,8 +366,7 @@ class CollectionHelpers:
         Returns:
             Dictionary mapping BPM values to track counts, sorted by count descending.
         """
-        counter = Counter(track.bpm for track in collection.tracks.values())
-        return dict(counter.most_common())
+        return dict(_most_common(collection, "bpm"))
 
     @staticmethod
     def key_distribution(collection: Collection) -> dict[str, int]:
@@ -180,8 +378,7 @@ class CollectionHelpers:
         Returns:
             Dictionary mapping key names to track counts, sorted by count descending.
         """
-        counter = Counter(track.key for track in collection.tracks.values())
-        return dict(counter.most_common())
+        return dict(_most_common(collection, "key"))
 
     @staticmethod
     def artists_by_track_count(collection: Collection) -> list[tuple[str, int]]:
@@ -193,8 +390,30 @@ class CollectionHelpers:
         Returns:
             List of (artist, count) tuples, sorted by count descending.
         """
-        counter = Counter(track.artist for track in collection.tracks.values())
-        return counter.most_common()
+        return list(_most_common(collection, "artist"))
+
+    @staticmethod
+    def collection_stats(collection: Collection) -> dict[str, Any]:
+        """Compute all collection statistics at once.
+
+        Equivalent to calling the four statistics helpers in turn. Results are
+        memoized on the collection, so statistics that were already requested
+        are not counted again.
+
+        Args:
+            collection: The Collection to analyze.
+
+        Returns:
+            Dictionary with the keys "genre_counts", "bpm_distribution",
+            "key_distribution" and "artists_by_track_count", each holding the
+            result of the helper of the same name.
+        """
+        return {
+            "genre_counts": CollectionHelpers.genre_counts(collection),
+            "bpm_distribution": CollectionHelpers.bpm_distribution(collection),
+            "key_distribution": CollectionHelpers.key_distribution(collection),
+            "artists_by_track_count": CollectionHelpers.artists_by_track_count(collection),
+        }
 
 
 # Convenience functions that wrap the static methods
@@ -255,3 +474,8 @@ def key_distribution(collection: Collection) -> dict[str, int]:
 def artists_by_track_count(collection: Collection) -> list[tuple[str, int]]:
     """Get artists sorted by number of tracks. See CollectionHelpers.artists_by_track_count."""
     return CollectionHelpers.artists_by_track_count(collection)
+
+
+def collection_stats(collection: Collection) -> dict[str, Any]:
+    """Compute all collection statistics at once. See CollectionHelpers.collection_stats."""
+    return CollectionHelpers.collection_stats(collection)
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
-# Camelot key mapping for key conversion
-CAMELOT_KEYS: dict[str, str] = {
+# Camelot key mapping for key conversion. Keys are interned like the parser's
+# Tonality values, so lookups for parsed tracks match by identity.
+CAMELOT_KEYS: dict[str, str] = {sys.intern(key): camelot for key, camelot in {
     # Minor keys
     "Abm": "1A", "Ebm": "2A", "Bbm": "3A", "Fm": "4A",
     "Cm": "5A", "Gm": "6A", "Dm": "7A", "Am": "8A",
@@ -25,12 +27,14 @@ CAMELOT_KEYS: dict[str, str] = {
     "G#m": "1A", "D#m": "2A", "A#m": "3A",
     "C#m": "12A", "Gb": "2B", "C#": "3B", "G#": "4B",
     "D#": "5B", "A#": "6B",
-}
+}.items()}
 
 
 class Tempo(BaseModel):
     """Tempo/BPM grid information for a track."""
 
+    model_config = ConfigDict(frozen=True)
+
     inizio: float = Field(description="Start position in seconds")
     bpm: float = Field(description="Beats per minute")
     metro: str = Field(default="4/4", description="Time signature")
@@ -40,6 +44,8 @@ class Tempo(BaseModel):
 class PositionMark(BaseModel):
     """Cue point or memory cue marker."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(default="", description="Cue point name/label")
     type: int = Field(default=0, description="Marker type (0=cue, 1=fade-in, 2=fade-out, 3=load, 4=loop)")
     start: float = Field(description="Position in seconds")
@@ -69,6 +75,8 @@ class PositionMark(BaseModel):
 class Track(BaseModel):
     """A track in the rekordbox collection."""
 
+    model_config = ConfigDict(frozen=True)
+
     track_id: int = Field(description="Unique track identifier")
     name: str = Field(description="Track title")
     artist: str = Field(default="", description="Artist name")
@@ -97,15 +105,41 @@ class Track(BaseModel):
     tempos: list[Tempo] = Field(default_factory=list, description="Tempo grid information")
     cue_points: list[PositionMark] = Field(default_factory=list, description="Cue points and memory cues")
 
+    def _cue_partition(self) -> tuple[list[PositionMark], list[PositionMark]]:
+        """Split cue_points into (hot cues, memory cues) in a single pass.
+
+        The result is cached in the instance ``__dict__`` together with a
+        snapshot of the cues it was built from, and reused only while
+        ``cue_points`` still holds the same cues. That covers both copies made
+        with ``model_copy(update=...)``, which copy ``__dict__``, and the list
+        being edited in place.
+        """
+        snapshot = tuple(self.cue_points)
+        cached = self.__dict__.get("_cached_cue_partition")
+        if cached is not None and cached[0] == snapshot:
+            return cached[1], cached[2]
+
+        hot: list[PositionMark] = []
+        memory: list[PositionMark] = []
+        for cue in snapshot:
+            num = cue.num
+            if num >= 0:
+                hot.append(cue)
+            elif num == -1:
+                memory.append(cue)
+        # Written directly: the model is frozen and this is not a field
+        self.__dict__["_cached_cue_partition"] = (snapshot, hot, memory)
+        return hot, memory
+
     @property
     def hot_cues(self) -> list[PositionMark]:
         """Return only hot cues (numbered 0-7)."""
-        return [cue for cue in self.cue_points if cue.is_hot_cue]
+        return self._cue_partition()[0]
 
     @property
     def memory_cues(self) -> list[PositionMark]:
         """Return only memory cues (num == -1)."""
-        return [cue for cue in self.cue_points if cue.is_memory_cue]
+        return self._cue_partition()[1]
 
     @property
     def camelot_key(self) -> str:
@@ -131,6 +165,8 @@ class Track(BaseModel):
 class PlaylistNode(BaseModel):
     """A playlist or folder node in the playlist tree."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Playlist or folder name")
     node_type: int = Field(description="0 = folder, 1 = playlist")
     track_keys: list[int] = Field(default_factory=list, description="Track IDs (for playlists)")
@@ -147,27 +183,47 @@ class PlaylistNode(BaseModel):
         return self.node_type == 1
 
     def iter_playlists(self) -> Iterator[PlaylistNode]:
-        """Recursively iterate through all playlists in this node and its children."""
-        if self.is_playlist:
-            yield self
-        for child in self.children:
-            yield from child.iter_playlists()
+        """Iterate through all playlists in this node and its children, depth-first."""
+        # Explicit stack instead of recursion: no generator per folder and no
+        # recursion limit on deeply nested trees.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.is_playlist:
+                yield node
+            stack.extend(reversed(node.children))
 
     def find_playlist(self, name: str) -> PlaylistNode | None:
-        """Find a playlist by name (searches recursively)."""
-        if self.is_playlist and self.name == name:
-            return self
-        for child in self.children:
-            result = child.find_playlist(name)
-            if result is not None:
-                return result
+        """Find a playlist by name, depth-first. Stops at the first match."""
+        for playlist in self.iter_playlists():
+            if playlist.name == name:
+                return playlist
         return None
 
 
 class Collection(BaseModel):
-    """The complete rekordbox collection."""
+    """The complete rekordbox collection.
+
+    Tracks, cues and playlist nodes are frozen. The helper functions cache
+    derived data on the collection the first time they need it. Adding or
+    removing tracks, or assigning a new ``tracks`` dict or playlist tree, is
+    picked up on the next call. Replacing a track under an existing ID, or
+    editing folder ``children`` in place, is not.
+    """
 
     product_name: str = Field(default="rekordbox", description="Product name")
     product_version: str = Field(default="", description="Product version")
     tracks: dict[int, Track] = Field(default_factory=dict, description="Tracks keyed by TrackID")
     playlists: PlaylistNode = Field(description="Root playlist node")
+
+    # Views of the tracks built lazily by helpers._most_common(),
+    # helpers._filter_columns() and helpers._search_columns()
+    _track_counts: Any = PrivateAttr(default=None)
+    _filter_columns: Any = PrivateAttr(default=None)
+    _search_columns: Any = PrivateAttr(default=None)
+    # Playlist lookups filled by helpers._index_playlists(): name -> first
+    # playlist with that name, every playlist name in tree order, and the
+    # root node they were built from
+    _playlist_index: dict[str, PlaylistNode] | None = PrivateAttr(default=None)
+    _playlist_names: list[str] | None = PrivateAttr(default=None)
+    _indexed_playlists: PlaylistNode | None = PrivateAttr(default=None)
@@ -2,19 +2,59 @@
 
 from __future__ import annotations
 
+import os
+import pickle
 import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from sys import intern
+from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
+from .helpers import _index_playlists
 from .models import Collection, PlaylistNode, PositionMark, Tempo, Track
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-def parse_collection(xml_path: str | Path) -> Collection:
+# Raw attributes of one TRACK and of its TEMPO and POSITION_MARK children
+_TrackRecord = tuple[dict[str, str], list[dict[str, str]], list[dict[str, str]]]
+
+# Number of TRACK records sent to a worker process at a time
+_TRACK_BATCH_SIZE = 1024
+
+# Collections with fewer tracks than this are parsed in-process even when
+# workers are requested, since starting the pool would cost more than it saves
+_PARALLEL_MIN_TRACKS = 2048
+
+# Parsed-collection cache written next to the XML file by parse_collection(cache=True).
+# Bump _CACHE_FORMAT whenever the pickled layout changes incompatibly.
+_CACHE_SUFFIX = ".rbcache"
+_CACHE_FORMAT = 2
+
+
+def parse_collection(
+    xml_path: str | Path, *, workers: int | None = None, cache: bool = False
+) -> Collection:
     """Parse a rekordbox XML export file into a Collection object.
 
     Args:
         xml_path: Path to the rekordbox XML export file.
+        workers: Number of worker processes used to build Track objects. By
+            default everything is parsed in the calling process. With more
+            than one worker, batches of raw TRACK attributes are handed to a
+            process pool once the collection turns out to be large enough
+            for that to pay off; smaller ones are still parsed in-process. On
+            platforms that spawn worker processes, the calling script must be
+            guarded by ``if __name__ == "__main__":``.
+        cache: If True, keep a pickled copy of the parsed collection next to
+            the XML file (``<name>.rbcache``) and load that instead of
+            parsing again for as long as the XML file's size and modification
+            time are unchanged. The cache is read with pickle, so only enable
+            this for directories you trust.
 
     Returns:
         A Collection object containing all tracks and playlists.
@@ -24,134 +64,288 @@ def parse_collection(xml_path: str | Path) -> Collection:
         ET.ParseError: If the XML is malformed.
     """
     xml_path = Path(xml_path)
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    if not cache:
+        return _parse_xml(xml_path, workers)
 
-    # Parse product info
-    product_elem = root.find("PRODUCT")
-    product_name = product_elem.get("Name", "rekordbox") if product_elem is not None else "rekordbox"
-    product_version = product_elem.get("Version", "") if product_elem is not None else ""
+    cache_path = xml_path.with_name(xml_path.name + _CACHE_SUFFIX)
+    cache_key = _cache_key(xml_path)
+    collection = _load_cached_collection(cache_path, cache_key)
+    if collection is None:
+        collection = _parse_xml(xml_path, workers)
+        _write_cached_collection(cache_path, cache_key, collection)
+    return collection
 
-    # Parse tracks
+
+def _parse_xml(xml_path: Path, workers: int | None) -> Collection:
+    """Stream-parse a rekordbox XML file. See parse_collection."""
+    product_name = "rekordbox"
+    product_version = ""
     tracks: dict[int, Track] = {}
-    collection_elem = root.find("COLLECTION")
-    if collection_elem is not None:
-        for track_elem in collection_elem.findall("TRACK"):
-            track = _parse_track(track_elem)
-            tracks[track.track_id] = track
+    playlists = PlaylistNode(name="ROOT", node_type=0)
+    found_playlists: list[PlaylistNode] = []
+
+    # Stream the document instead of building the full tree: each TRACK is
+    # parsed as soon as it is complete and then dropped, so only one TRACK
+    # subtree (plus the comparatively small PLAYLISTS subtree) is ever held
+    # in memory.
+    stack: list[ET.Element] = []
+    records: list[_TrackRecord] = []
+    pending: list[Future[list[Track]]] = []
+    use_pool = workers is not None and workers > 1
+    pool: ProcessPoolExecutor | None = None
+    with ExitStack() as exits, xml_path.open("rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
 
-    # Parse playlists
-    playlists_elem = root.find("PLAYLISTS")
-    if playlists_elem is not None:
-        root_node = playlists_elem.find("NODE")
-        playlists = _parse_playlist_node(root_node) if root_node is not None else PlaylistNode(name="ROOT", node_type=0)
-    else:
-        playlists = PlaylistNode(name="ROOT", node_type=0)
+            stack.pop()
+            depth = len(stack)
+            tag = elem.tag
 
-    return Collection(
+            if depth == 2 and tag == "TRACK" and stack[1].tag == "COLLECTION":
+                if not use_pool:
+                    track = _parse_track(elem)
+                    tracks[track.track_id] = track
+                else:
+                    # Buffer records until there are enough to be worth a
+                    # pool, then hand them out one batch at a time
+                    records.append(_track_record(elem))
+                    if pool is None and len(records) >= _PARALLEL_MIN_TRACKS:
+                        pool = exits.enter_context(ProcessPoolExecutor(max_workers=workers))
+                    if pool is not None and len(records) >= _TRACK_BATCH_SIZE:
+                        pending.append(pool.submit(_parse_track_batch, records[:_TRACK_BATCH_SIZE]))
+                        del records[:_TRACK_BATCH_SIZE]
+                elem.clear()
+                stack[1].remove(elem)
+            elif depth == 1 and tag == "PRODUCT":
+                product_name = elem.get("Name", "rekordbox")
+                product_version = elem.get("Version", "")
+            elif depth == 1 and tag == "PLAYLISTS":
+                root_node = elem.find("NODE")
+                if root_node is not None:
+                    playlists = _parse_playlist_node(root_node, found_playlists)
+                elem.clear()
+
+        # Merge in submission order so tracks keep their document order
+        for future in pending:
+            for track in future.result():
+                tracks[track.track_id] = track
+        # Whatever is left is less than a batch, or the whole collection
+        # when it was too small for the pool
+        for track in _parse_track_batch(records):
+            tracks[track.track_id] = track
+
+    collection = Collection(
         product_name=product_name,
         product_version=product_version,
         tracks=tracks,
         playlists=playlists,
     )
+    _index_playlists(collection, found_playlists)
+    return collection
+
+
+def _cache_key(xml_path: Path) -> tuple[object, ...]:
+    """Identify the XML file contents and model layout a cache was written for.
+
+    The pickle holds the whole Collection, private attributes included, so
+    the fields of every pickled model and those attribute names are all part
+    of the layout.
+    """
+    stat = xml_path.stat()
+    return (
+        _CACHE_FORMAT,
+        *(tuple(model.model_fields) for model in (Track, Tempo, PositionMark, PlaylistNode)),
+        tuple(Collection.__private_attributes__),
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+
+
+def _load_cached_collection(cache_path: Path, cache_key: tuple[object, ...]) -> Collection | None:
+    """Load a cached collection, or return None if there is no usable cache."""
+    try:
+        with cache_path.open("rb") as f:
+            if pickle.load(f) != cache_key:
+                return None
+            collection = pickle.load(f)
+    except Exception:
+        # A missing, truncated or otherwise unreadable cache just means
+        # parsing the XML again.
+        return None
+    return collection if isinstance(collection, Collection) else None
+
+
+def _write_cached_collection(
+    cache_path: Path, cache_key: tuple[object, ...], collection: Collection
+) -> None:
+    """Write the cache file atomically; failing to write it is not an error."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump(cache_key, f, protocol=5)
+            pickle.dump(collection, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
 def _parse_track(elem: ET.Element) -> Track:
     """Parse a TRACK element into a Track object."""
+    return _parse_track_from_attribs(
+        elem.attrib,
+        [t.attrib for t in elem.findall("TEMPO")],
+        [p.attrib for p in elem.findall("POSITION_MARK")],
+    )
+
+
+def _track_record(elem: ET.Element) -> _TrackRecord:
+    """Copy the attributes of a TRACK element and its children into plain dicts.
+
+    The copies outlive ``elem.clear()`` and can be pickled to a worker process.
+    """
+    return (
+        dict(elem.attrib),
+        [dict(t.attrib) for t in elem.findall("TEMPO")],
+        [dict(p.attrib) for p in elem.findall("POSITION_MARK")],
+    )
+
+
+def _parse_track_batch(records: list[_TrackRecord]) -> list[Track]:
+    """Build Track objects from a batch of TRACK records, usually in a worker process."""
+    return [_parse_track_from_attribs(*record) for record in records]
+
+
+def _parse_track_from_attribs(
+    attrib: Mapping[str, str],
+    tempo_attribs: list[Mapping[str, str]],
+    mark_attribs: list[Mapping[str, str]],
+) -> Track:
+    """Build a Track object from the attributes of a TRACK element and its children."""
     # Parse tempos
-    tempos = [_parse_tempo(t) for t in elem.findall("TEMPO")]
+    tempos = [_parse_tempo(t) for t in tempo_attribs]
 
     # Parse cue points
-    cue_points = [_parse_position_mark(p) for p in elem.findall("POSITION_MARK")]
+    cue_points = [_parse_position_mark(p) for p in mark_attribs]
 
     # Parse location and URL-decode it
-    location_raw = elem.get("Location", "")
+    location_raw = attrib.get("Location", "")
     # Remove file://localhost prefix and URL-decode
     location = _decode_location(location_raw)
 
-    # Parse date
-    date_str = elem.get("DateAdded", "")
-    date_added = date.fromisoformat(date_str) if date_str else date.today()
+    # Parse date, ignoring any time component after the ISO date
+    date_str = attrib.get("DateAdded", "")
+    date_added = date.fromisoformat(date_str[:10]) if date_str else date.today()
 
+    # Low-cardinality strings (genre, key, kind, label) are interned so equal
+    # values share one object across tracks
+    get = attrib.get
     return Track(
-        track_id=int(elem.get("TrackID", "0")),
-        name=elem.get("Name", ""),
-        artist=elem.get("Artist", ""),
-        album=elem.get("Album", ""),
-        genre=elem.get("Genre", ""),
-        bpm=float(elem.get("AverageBpm", "0")),
-        key=elem.get("Tonality", ""),
-        duration=int(elem.get("TotalTime", "0")),
+        track_id=int(get("TrackID", "0")),
+        name=get("Name", ""),
+        artist=get("Artist", ""),
+        album=get("Album", ""),
+        genre=intern(get("Genre", "")),
+        bpm=float(get("AverageBpm", "0")),
+        key=intern(get("Tonality", "")),
+        duration=int(get("TotalTime", "0")),
         location=location,
         date_added=date_added,
-        play_count=int(elem.get("PlayCount", "0")),
-        rating=int(elem.get("Rating", "0")),
-        kind=elem.get("Kind", ""),
-        size=int(elem.get("Size", "0")),
-        bit_rate=int(elem.get("BitRate", "0")),
-        sample_rate=int(elem.get("SampleRate", "0")),
-        comments=elem.get("Comments", ""),
-        label=elem.get("Label", ""),
-        remixer=elem.get("Remixer", ""),
-        composer=elem.get("Composer", ""),
-        grouping=elem.get("Grouping", ""),
-        mix=elem.get("Mix", ""),
-        year=int(elem.get("Year", "0")),
-        disc_number=int(elem.get("DiscNumber", "0")),
-        track_number=int(elem.get("TrackNumber", "0")),
+        play_count=int(get("PlayCount", "0")),
+        rating=int(get("Rating", "0")),
+        kind=intern(get("Kind", "")),
+        size=int(get("Size", "0")),
+        bit_rate=int(get("BitRate", "0")),
+        sample_rate=int(get("SampleRate", "0")),
+        comments=get("Comments", ""),
+        label=intern(get("Label", "")),
+        remixer=get("Remixer", ""),
+        composer=get("Composer", ""),
+        grouping=get("Grouping", ""),
+        mix=get("Mix", ""),
+        year=int(get("Year", "0")),
+        disc_number=int(get("DiscNumber", "0")),
+        track_number=int(get("TrackNumber", "0")),
         tempos=tempos,
         cue_points=cue_points,
     )
 
 
-def _parse_tempo(elem: ET.Element) -> Tempo:
-    """Parse a TEMPO element into a Tempo object."""
+def _parse_tempo(attrib: Mapping[str, str]) -> Tempo:
+    """Parse the attributes of a TEMPO element into a Tempo object."""
     return Tempo(
-        inizio=float(elem.get("Inizio", "0")),
-        bpm=float(elem.get("Bpm", "0")),
-        metro=elem.get("Metro", "4/4"),
-        battito=int(elem.get("Battito", "1")),
+        inizio=float(attrib.get("Inizio", "0")),
+        bpm=float(attrib.get("Bpm", "0")),
+        metro=attrib.get("Metro", "4/4"),
+        battito=int(attrib.get("Battito", "1")),
     )
 
 
-def _parse_position_mark(elem: ET.Element) -> PositionMark:
-    """Parse a POSITION_MARK element into a PositionMark object."""
-    red = elem.get("Red")
-    green = elem.get("Green")
-    blue = elem.get("Blue")
+def _parse_position_mark(attrib: Mapping[str, str]) -> PositionMark:
+    """Parse the attributes of a POSITION_MARK element into a PositionMark object."""
+    red = attrib.get("Red")
+    green = attrib.get("Green")
+    blue = attrib.get("Blue")
 
     return PositionMark(
-        name=elem.get("Name", ""),
-        type=int(elem.get("Type", "0")),
-        start=float(elem.get("Start", "0")),
-        num=int(elem.get("Num", "-1")),
+        name=attrib.get("Name", ""),
+        type=int(attrib.get("Type", "0")),
+        start=float(attrib.get("Start", "0")),
+        num=int(attrib.get("Num", "-1")),
         red=int(red) if red is not None else None,
         green=int(green) if green is not None else None,
         blue=int(blue) if blue is not None else None,
     )
 
 
-def _parse_playlist_node(elem: ET.Element) -> PlaylistNode:
-    """Parse a NODE element into a PlaylistNode object (recursive)."""
-    node_type = int(elem.get("Type", "0"))
-    name = elem.get("Name", "")
-
-    if node_type == 1:  # Playlist
-        # Get track keys
-        track_keys = [int(t.get("Key", "0")) for t in elem.findall("TRACK")]
-        return PlaylistNode(
-            name=name,
-            node_type=node_type,
-            track_keys=track_keys,
-        )
-    else:  # Folder
-        # Recursively parse children
-        children = [_parse_playlist_node(child) for child in elem.findall("NODE")]
-        return PlaylistNode(
-            name=name,
-            node_type=node_type,
-            children=children,
-        )
+def _parse_playlist_node(
+    elem: ET.Element, found: list[PlaylistNode] | None = None
+) -> PlaylistNode:
+    """Parse a NODE element into a PlaylistNode object.
+
+    The tree is walked with an explicit stack, so deeply nested folders cannot
+    hit the recursion limit. If ``found`` is given, every playlist (not
+    folder) is appended to it in document order.
+    """
+    result: list[PlaylistNode] = []
+    # (NODE element, list its PlaylistNode gets appended to, the folder's
+    # finished children or None if they have not been parsed yet)
+    stack: list[tuple[ET.Element, list[PlaylistNode], list[PlaylistNode] | None]] = [
+        (elem, result, None)
+    ]
+    while stack:
+        node_elem, siblings, children = stack.pop()
+        node_type = int(node_elem.get("Type", "0"))
+        name = node_elem.get("Name", "")
+
+        if node_type == 1:  # Playlist
+            # Get track keys
+            track_keys = [int(t.get("Key", "0")) for t in node_elem.findall("TRACK")]
+            node = PlaylistNode(
+                name=name,
+                node_type=node_type,
+                track_keys=track_keys,
+            )
+            if found is not None:
+                found.append(node)
+        elif children is None:  # Folder, first visit
+            # Revisit the folder once all of its children have been parsed;
+            # they are pushed in reverse so they are visited in document order
+            children = []
+            stack.append((node_elem, siblings, children))
+            stack.extend((child, children, None) for child in reversed(node_elem.findall("NODE")))
+            continue
+        else:  # Folder, children done
+            node = PlaylistNode(
+                name=name,
+                node_type=node_type,
+                children=children,
+            )
+
+        siblings.append(node)
+
+    return result[0]
 
 
 def _decode_location(location: str) -> str:
@@ -168,5 +362,19 @@ def _decode_location(location: str) -> str:
     if location.startswith("file://localhost"):
         location = location[16:]  # len("file://localhost") == 16
 
-    # URL-decode the path
-    return unquote(location)
+    # URL-decode the path; most paths have nothing to decode
+    if "%" not in location:
+        return location
+    # Tracks share a handful of directories, so only the file name usually
+    # needs decoding. Splitting on a literal "/" never cuts through an
+    # escape sequence, so this decodes exactly like unquote(location).
+    directory, sep, filename = location.rpartition("/")
+    if "%" in filename:
+        filename = unquote(filename)
+    return _decode_directory(directory) + sep + filename
+
+
+@lru_cache(maxsize=4096)
+def _decode_directory(directory: str) -> str:
+    """URL-decode the directory part of a location, cached across tracks."""
+    return unquote(directory)
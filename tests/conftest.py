@@ -0,0 +1,16 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from rekordbox_collection_reader.parser import parse_collection
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+TEST_COLLECTION_PATH = FIXTURES_DIR / "test_collection.xml"
+
+
+@pytest.fixture(scope="session")
+def collection():
+    # Parsed once for the whole session; tests must not modify it
+    return parse_collection(TEST_COLLECTION_PATH)
@@ -1,13 +1,13 @@
 """Tests for helper functions."""
 
 from datetime import date
-from pathlib import Path
-
-import pytest
 
 from rekordbox_collection_reader.helpers import (
+    _filter_columns,
+    _search_columns,
     artists_by_track_count,
     bpm_distribution,
+    collection_stats,
     filter_tracks,
     genre_counts,
     get_playlist,
@@ -15,15 +15,7 @@ from rekordbox_collection_reader.helpers import (
     key_distribution,
     search,
 )
-from rekordbox_collection_reader.parser import parse_collection
-
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-TEST_COLLECTION_PATH = FIXTURES_DIR / "test_collection.xml"
-
-
-@pytest.fixture
-def collection():
-    return parse_collection(TEST_COLLECTION_PATH)
+from rekordbox_collection_reader.models import Collection, PlaylistNode, Track
 
 
 class TestFilterTracks:
@@ -57,6 +49,16 @@ class TestFilterTracks:
         results = filter_tracks(collection, key="gm")
         assert len(results) == 1
 
+    def test_filter_by_genre_and_key(self, collection):
+        results = filter_tracks(collection, genre="techno", key="AM")
+        assert results == [
+            t for t in collection.tracks.values() if t.genre == "Techno" and t.key == "Am"
+        ]
+        assert len(results) > 0
+
+    def test_filter_by_unknown_key(self, collection):
+        assert filter_tracks(collection, key="H#m") == []
+
     def test_filter_by_artist(self, collection):
         results = filter_tracks(collection, artist="Charlotte")
         assert len(results) == 1
@@ -108,6 +110,42 @@ class TestFilterTracks:
         results = filter_tracks(collection)
         assert len(results) == 15
 
+    def test_filter_combined_numeric_criteria(self, collection):
+        results = filter_tracks(
+            collection,
+            bpm_range=(125, 140),
+            min_play_count=10,
+            date_range=(date(2020, 1, 1), date(2021, 12, 31)),
+        )
+        expected = [
+            t
+            for t in collection.tracks.values()
+            if 125 <= t.bpm <= 140
+            and t.play_count >= 10
+            and date(2020, 1, 1) <= t.date_added <= date(2021, 12, 31)
+        ]
+        assert results == expected
+        assert len(results) > 0
+
+    def test_unset_bpm_range_ignores_nan_bpm(self):
+        track = Track(
+            track_id=1,
+            name="One",
+            location="/1.wav",
+            date_added=date(2020, 1, 1),
+            bpm=float("nan"),
+            play_count=3,
+        )
+        collection = Collection(playlists=PlaylistNode(name="ROOT", node_type=0), tracks={1: track})
+        assert filter_tracks(collection, min_play_count=1) == [track]
+        assert filter_tracks(collection, bpm_range=(0, 200)) == []
+
+    def test_filter_preserves_collection_order(self, collection):
+        results = filter_tracks(collection, bpm_range=(120, 150), min_play_count=1)
+        ids = [t.track_id for t in results]
+        order = list(collection.tracks)
+        assert ids == sorted(ids, key=order.index)
+
 
 class TestSearch:
     """Tests for search function."""
@@ -145,6 +183,11 @@ class TestSearch:
         results = search(collection, "Above & Beyond")
         assert len(results) == 1
 
+    def test_search_does_not_span_fields(self, collection):
+        # Name "Strobe (Original Mix)" followed by artist "Deadmau5"
+        assert search(collection, "Mix)Deadmau5") == []
+        assert search(collection, "Mix)\x1fDeadmau5") == []
+
 
 class TestGetPlaylist:
     """Tests for get_playlist function."""
@@ -182,10 +225,62 @@ class TestGetPlaylist:
         # Order should be 1, 6, 13 as defined in XML
         assert [t.track_id for t in tracks] == [1, 6, 13]
 
+    def test_hand_built_collection(self):
+        collection = Collection(
+            playlists=PlaylistNode(
+                name="ROOT",
+                node_type=0,
+                children=[
+                    PlaylistNode(
+                        name="Folder",
+                        node_type=0,
+                        children=[PlaylistNode(name="Dupe", node_type=1, track_keys=[1])],
+                    ),
+                    PlaylistNode(name="Dupe", node_type=1, track_keys=[2]),
+                ],
+            ),
+            tracks={
+                1: Track(track_id=1, name="One", location="/1.wav", date_added=date(2020, 1, 1)),
+                2: Track(track_id=2, name="Two", location="/2.wav", date_added=date(2020, 1, 1)),
+            },
+        )
+        # The first playlist in the tree wins when names repeat
+        tracks = get_playlist(collection, "Dupe")
+        assert tracks is not None
+        assert [t.track_id for t in tracks] == [1]
+
+    def test_skips_missing_tracks(self):
+        collection = Collection(
+            playlists=PlaylistNode(
+                name="ROOT",
+                node_type=0,
+                children=[PlaylistNode(name="Gaps", node_type=1, track_keys=[1, 99, 1])],
+            ),
+            tracks={
+                1: Track(track_id=1, name="One", location="/1.wav", date_added=date(2020, 1, 1)),
+            },
+        )
+        tracks = get_playlist(collection, "Gaps")
+        assert tracks is not None
+        assert [t.track_id for t in tracks] == [1, 1]
+
 
 class TestGetPlaylistNames:
     """Tests for get_playlist_names function."""
 
+    def test_model_copy_with_new_playlists(self, collection):
+        assert get_playlist_names(collection)
+        playlists = PlaylistNode(
+            name="ROOT",
+            node_type=0,
+            children=[PlaylistNode(name="Only", node_type=1, track_keys=[1])],
+        )
+        copy = collection.model_copy(update={"playlists": playlists})
+        assert get_playlist_names(copy) == ["Only"]
+        assert get_playlist(copy, "Favorites") is None
+        assert get_playlist(copy, "Only") == [collection.tracks[1]]
+        assert "Favorites" in get_playlist_names(collection)
+
     def test_returns_all_playlists(self, collection):
         names = get_playlist_names(collection)
         assert "Favorites" in names
@@ -207,6 +302,28 @@ class TestGetPlaylistNames:
         # Main Room is deeply nested
         assert "Main Room" in names
 
+    def test_matches_tree_order(self, collection):
+        names = get_playlist_names(collection)
+        assert names == [p.name for p in collection.playlists.iter_playlists()]
+
+    def test_returns_a_copy(self, collection):
+        get_playlist_names(collection).clear()
+        assert "Favorites" in get_playlist_names(collection)
+
+    def test_keeps_duplicate_names(self):
+        collection = Collection(
+            playlists=PlaylistNode(
+                name="ROOT",
+                node_type=0,
+                children=[
+                    PlaylistNode(name="Dupe", node_type=1),
+                    PlaylistNode(name="Other", node_type=1),
+                    PlaylistNode(name="Dupe", node_type=1),
+                ],
+            ),
+        )
+        assert get_playlist_names(collection) == ["Dupe", "Other", "Dupe"]
+
 
 class TestGenreCounts:
     """Tests for genre_counts function."""
@@ -276,3 +393,85 @@ class TestArtistsByTrackCount:
         assert "Deadmau5" in artist_names
         assert "Charlotte de Witte" in artist_names
         assert "Eric Prydz" in artist_names
+
+
+class TestCollectionStats:
+    """Tests for collection_stats function."""
+
+    def test_matches_individual_helpers(self, collection):
+        stats = collection_stats(collection)
+        assert stats == {
+            "genre_counts": genre_counts(collection),
+            "bpm_distribution": bpm_distribution(collection),
+            "key_distribution": key_distribution(collection),
+            "artists_by_track_count": artists_by_track_count(collection),
+        }
+
+    def test_repeated_calls_return_fresh_copies(self, collection):
+        counts = genre_counts(collection)
+        counts.clear()
+        artists = artists_by_track_count(collection)
+        artists.clear()
+        assert genre_counts(collection)
+        assert artists_by_track_count(collection)
+        assert genre_counts(collection) is not genre_counts(collection)
+
+    def test_model_copy_keeps_counts_separate(self, collection):
+        all_genres = genre_counts(collection)
+        techno = {tid: t for tid, t in collection.tracks.items() if t.genre == "Techno"}
+        subset = collection.model_copy(update={"tracks": techno})
+        assert genre_counts(subset) == {"Techno": len(techno)}
+        assert genre_counts(collection) == all_genres
+
+
+class TestTrackViews:
+    """Tests for the cached views of the tracks used by the helpers."""
+
+    def test_filter_columns_follow_track_order(self, collection):
+        columns = _filter_columns(collection)
+        tracks = list(collection.tracks.values())
+        assert columns.tracks == tracks
+        assert columns.bpms == [t.bpm for t in tracks]
+        assert columns.keys_lower == [t.key.lower() for t in tracks]
+
+    def test_views_built_once(self, collection):
+        assert _filter_columns(collection) is _filter_columns(collection)
+        assert _search_columns(collection) is _search_columns(collection)
+
+    def test_tracks_added_in_place(self, collection):
+        fresh = Collection(playlists=collection.playlists, tracks=collection.tracks)
+        techno = genre_counts(fresh)["Techno"]
+        assert len(filter_tracks(fresh)) == len(collection.tracks)
+        assert search(fresh, "new arrival") == []
+
+        track = Track(
+            track_id=999,
+            name="New Arrival",
+            genre="Techno",
+            location="/new.wav",
+            date_added=date(2024, 1, 1),
+        )
+        fresh.tracks[999] = track
+        assert genre_counts(fresh)["Techno"] == techno + 1
+        assert len(filter_tracks(fresh)) == len(collection.tracks) + 1
+        assert search(fresh, "new arrival") == [track]
+
+        del fresh.tracks[999]
+        assert genre_counts(fresh)["Techno"] == techno
+        assert search(fresh, "new arrival") == []
+
+    def test_helpers_build_only_their_view(self, collection):
+        fresh = Collection(playlists=collection.playlists, tracks=collection.tracks)
+        genre_counts(fresh)
+        assert fresh._filter_columns is None
+        assert fresh._search_columns is None
+        search(fresh, "strobe")
+        assert fresh._filter_columns is None
+
+    def test_model_copy_with_new_tracks(self, collection):
+        assert len(filter_tracks(collection)) == len(collection.tracks)
+        techno = {tid: t for tid, t in collection.tracks.items() if t.genre == "Techno"}
+        subset = collection.model_copy(update={"tracks": techno})
+        assert filter_tracks(subset) == list(techno.values())
+        assert search(subset, "") == list(techno.values())
+        assert len(filter_tracks(collection)) == len(collection.tracks)
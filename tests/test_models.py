@@ -1,8 +1,10 @@
 """Tests for Pydantic models."""
 
+import sys
 from datetime import date
 
 import pytest
+from pydantic import ValidationError
 
 from rekordbox_collection_reader.models import (
     CAMELOT_KEYS,
@@ -141,9 +143,34 @@ class TestTrack:
         assert len(memory_cues) == 1
         assert all(cue.num == -1 for cue in memory_cues)
 
+    def test_cue_partitions_cached(self, sample_track):
+        assert sample_track.hot_cues is sample_track.hot_cues
+        assert sample_track.memory_cues is sample_track.memory_cues
+
+    def test_cue_partitions_follow_model_copy(self, sample_track):
+        assert len(sample_track.hot_cues) == 2
+        copy = sample_track.model_copy(update={"cue_points": []})
+        assert copy.hot_cues == []
+        assert copy.memory_cues == []
+        assert len(sample_track.hot_cues) == 2
+
+    def test_cue_partitions_follow_in_place_edits(self, sample_track):
+        track = sample_track.model_copy(update={"cue_points": list(sample_track.cue_points)})
+        assert len(track.hot_cues) == 2
+        track.cue_points.append(PositionMark(start=9.0, num=5))
+        assert len(track.hot_cues) == 3
+        track.cue_points[-1] = PositionMark(start=9.0, num=-1)
+        assert len(track.hot_cues) == 2
+        assert len(track.memory_cues) == len(sample_track.memory_cues) + 1
+
     def test_camelot_key(self, sample_track):
         assert sample_track.camelot_key == "6A"
 
+    def test_camelot_key_follows_model_copy(self, sample_track):
+        assert sample_track.camelot_key
+        copy = sample_track.model_copy(update={"key": "Am"})
+        assert copy.camelot_key == "8A"
+
     def test_camelot_key_unknown(self):
         track = Track(
             track_id=1,
@@ -206,6 +233,10 @@ class TestTrack:
         assert track.tempos == []
         assert track.cue_points == []
 
+    def test_frozen(self, sample_track):
+        with pytest.raises(ValidationError):
+            sample_track.bpm = 140.0
+
 
 class TestPlaylistNode:
     """Tests for PlaylistNode model."""
@@ -254,6 +285,13 @@ class TestPlaylistNode:
         assert len(playlists) == 3
         assert [p.name for p in playlists] == ["Playlist 1", "Playlist 2", "Playlist 3"]
 
+    def test_iter_playlists_deeply_nested(self):
+        node = PlaylistNode(name="Bottom", node_type=1, track_keys=[1])
+        for depth in range(5000):
+            node = PlaylistNode(name=f"Folder {depth}", node_type=0, children=[node])
+        assert [p.name for p in node.iter_playlists()] == ["Bottom"]
+        assert node.find_playlist("Bottom") is not None
+
     def test_find_playlist_top_level(self):
         root = PlaylistNode(
             name="ROOT",
@@ -353,6 +391,10 @@ class TestCamelotKeys:
             assert key in CAMELOT_KEYS
             assert CAMELOT_KEYS[key].endswith("B")
 
+    def test_keys_are_interned(self):
+        for key in CAMELOT_KEYS:
+            assert sys.intern(key) is key
+
     def test_common_keys(self):
         assert CAMELOT_KEYS["Am"] == "8A"
         assert CAMELOT_KEYS["C"] == "8B"
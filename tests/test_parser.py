@@ -1,10 +1,15 @@
 """Tests for XML parser."""
 
+import shutil
+import xml.etree.ElementTree as ET
 from datetime import date
 from pathlib import Path
 
 import pytest
+from pydantic import PrivateAttr
 
+from rekordbox_collection_reader import parser
+from rekordbox_collection_reader.models import Collection, PlaylistNode, PositionMark, Tempo, Track
 from rekordbox_collection_reader.parser import _decode_location, parse_collection
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -14,10 +19,6 @@ TEST_COLLECTION_PATH = FIXTURES_DIR / "test_collection.xml"
 class TestParseCollection:
     """Tests for parse_collection function."""
 
-    @pytest.fixture
-    def collection(self):
-        return parse_collection(TEST_COLLECTION_PATH)
-
     def test_parses_successfully(self, collection):
         assert collection is not None
 
@@ -71,10 +72,19 @@ class TestParseCollection:
         assert track.artist == "Above & Beyond"
         assert "&amp;" not in track.artist
 
+    def test_repeated_strings_are_shared(self, collection):
+        # Tracks 2 and 3 are both Techno
+        assert collection.tracks[2].genre is collection.tracks[3].genre
+
     def test_date_added_parsing(self, collection):
         track = collection.tracks[1]
         assert track.date_added == date(2020, 1, 15)
 
+    def test_date_added_with_time_component(self):
+        attrib = {"TrackID": "1", "DateAdded": "2020-01-15T10:20:30"}
+        track = parser._parse_track_from_attribs(attrib, [], [])
+        assert track.date_added == date(2020, 1, 15)
+
     def test_track_with_no_cue_points(self, collection):
         # Track 4 (Armin) has only TEMPO, no POSITION_MARK
         track = collection.tracks[4]
@@ -136,12 +146,85 @@ class TestParseCollection:
         assert track3.comments == ""
 
 
-class TestPlaylistParsing:
-    """Tests for playlist parsing."""
+class TestParallelParsing:
+    """Tests for parse_collection with worker processes."""
+
+    def test_matches_serial_parse(self, monkeypatch):
+        # Small batches so the fixture is split across several workers
+        monkeypatch.setattr(parser, "_TRACK_BATCH_SIZE", 4)
+        monkeypatch.setattr(parser, "_PARALLEL_MIN_TRACKS", 8)
+        serial = parse_collection(TEST_COLLECTION_PATH)
+        parallel = parse_collection(TEST_COLLECTION_PATH, workers=2)
+        assert list(parallel.tracks) == list(serial.tracks)
+        assert parallel.tracks == serial.tracks
+        assert parallel.playlists == serial.playlists
+
+    def test_small_collection_skips_pool(self, monkeypatch, collection):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small collection")
+
+        monkeypatch.setattr(parser, "ProcessPoolExecutor", no_pool)
+        parallel = parse_collection(TEST_COLLECTION_PATH, workers=2)
+        assert list(parallel.tracks) == list(collection.tracks)
+        assert parallel.tracks == collection.tracks
+
+
+class TestParseCache:
+    """Tests for parse_collection with cache=True."""
 
     @pytest.fixture
-    def collection(self):
-        return parse_collection(TEST_COLLECTION_PATH)
+    def xml_file(self, tmp_path):
+        xml_file = tmp_path / "collection.xml"
+        shutil.copy(TEST_COLLECTION_PATH, xml_file)
+        return xml_file
+
+    def test_writes_cache(self, xml_file):
+        collection = parse_collection(xml_file, cache=True)
+        assert (xml_file.parent / "collection.xml.rbcache").exists()
+        assert collection.tracks == parse_collection(xml_file).tracks
+
+    def test_loads_from_cache(self, xml_file, monkeypatch):
+        first = parse_collection(xml_file, cache=True)
+
+        def fail(*args):
+            raise AssertionError("XML should not be parsed again")
+
+        monkeypatch.setattr(parser, "_parse_xml", fail)
+        second = parse_collection(xml_file, cache=True)
+        assert second.tracks == first.tracks
+        assert second.playlists == first.playlists
+        assert second.product_version == "6.8.5"
+
+    def test_stale_cache_is_ignored(self, xml_file):
+        parse_collection(xml_file, cache=True)
+        xml_file.write_text(xml_file.read_text().replace('Version="6.8.5"', 'Version="7.0.10"'))
+        assert parse_collection(xml_file, cache=True).product_version == "7.0.10"
+
+    def test_cache_from_other_collection_layout_is_ignored(self, xml_file, monkeypatch):
+        parse_collection(xml_file, cache=True)
+        private_attributes = {**Collection.__private_attributes__, "_added": PrivateAttr(default=None)}
+        monkeypatch.setattr(Collection, "__private_attributes__", private_attributes)
+
+        def parsed(*args):
+            raise RuntimeError("parsed again")
+
+        monkeypatch.setattr(parser, "_parse_xml", parsed)
+        with pytest.raises(RuntimeError, match="parsed again"):
+            parse_collection(xml_file, cache=True)
+
+    def test_cache_key_covers_all_pickled_models(self, xml_file):
+        key = parser._cache_key(xml_file)
+        for model in (Track, Tempo, PositionMark, PlaylistNode):
+            assert tuple(model.model_fields) in key
+
+    def test_corrupt_cache_is_ignored(self, xml_file):
+        (xml_file.parent / "collection.xml.rbcache").write_bytes(b"not a pickle")
+        collection = parse_collection(xml_file, cache=True)
+        assert len(collection.tracks) == 15
+
+
+class TestPlaylistParsing:
+    """Tests for playlist parsing."""
 
     def test_root_node(self, collection):
         assert collection.playlists.name == "ROOT"
@@ -201,6 +284,26 @@ class TestPlaylistParsing:
         result = collection.playlists.find_playlist("Does Not Exist")
         assert result is None
 
+    def test_deeply_nested_folders(self, tmp_path):
+        depth = 5000
+        xml_file = tmp_path / "deep.xml"
+        xml_file.write_text(
+            "<DJ_PLAYLISTS><COLLECTION/><PLAYLISTS>"
+            + '<NODE Type="0" Name="Folder">' * depth
+            + '<NODE Type="1" Name="Bottom"><TRACK Key="1"/></NODE>'
+            + "</NODE>" * depth
+            + "</PLAYLISTS></DJ_PLAYLISTS>"
+        )
+        collection = parse_collection(xml_file)
+        [bottom] = collection.playlists.iter_playlists()
+        assert bottom.name == "Bottom"
+        assert bottom.track_keys == [1]
+
+    def test_playlist_index(self, collection):
+        index = collection._playlist_index
+        assert set(index) == {p.name for p in collection.playlists.iter_playlists()}
+        assert index["Main Room"] is collection.playlists.find_playlist("Main Room")
+
 
 class TestDecodeLocation:
     """Tests for _decode_location helper."""
@@ -231,6 +334,17 @@ class TestDecodeLocation:
         result = _decode_location(location)
         assert result == "/Users/test/Music/Track (Original Mix).wav"
 
+    def test_hash_and_question_mark_kept_in_path(self):
+        # Unescaped "#" and "?" are part of the file name, not a URL fragment/query
+        location = "file://localhost/Users/test/Music/Track%20#1%20(Why?).wav"
+        result = _decode_location(location)
+        assert result == "/Users/test/Music/Track #1 (Why?).wav"
+
+    def test_encoded_directory_and_slash(self):
+        location = "file://localhost/Users/test/Caf%C3%A9%20Music/AC%2FDC%20-%20Track.wav"
+        result = _decode_location(location)
+        assert result == "/Users/test/Café Music/AC/DC - Track.wav"
+
 
 class TestFileErrors:
     """Tests for error handling."""
@@ -239,6 +353,12 @@ class TestFileErrors:
         with pytest.raises(FileNotFoundError):
             parse_collection("/nonexistent/path/collection.xml")
 
+    def test_malformed_xml(self, tmp_path):
+        xml_file = tmp_path / "broken.xml"
+        xml_file.write_text('<DJ_PLAYLISTS><COLLECTION><TRACK TrackID="1"></COLLECTION>')
+        with pytest.raises(ET.ParseError):
+            parse_collection(xml_file)
+
     def test_accepts_path_object(self):
         # Should work with Path objects
         collection = parse_collection(Path(TEST_COLLECTION_PATH))